@@ -4,14 +4,26 @@ This module provides basic utility functions that are used across the project,
 particularly for handling dicts.
 """
 
+import re
 import typing as t
 from collections.abc import Iterable
+from functools import lru_cache
 
 
 class NotSpecified:  # pylint: disable=too-few-public-methods
     """Sentinel class to distinguish between None and no default value provided."""
 
 
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-separated path into a tuple of keys (cached).
+
+    Hot callers pass the same literal path over and over; caching the split
+    avoids a string scan plus a list allocation per call.
+    """
+    return tuple(path.split("."))
+
+
 def get_multi(data, path: str | list[str], default=NotSpecified):
     """Get a value from nested dictionary using a dot-separated path.
 
@@ -28,11 +40,13 @@ def get_multi(data, path: str | list[str], default=NotSpecified):
         TypeError: If intermediate value is not subscriptable.
     """
     if isinstance(path, str):
-        path = path.split(".")
+        path = _split_path(path)
     try:
-        return get_multi(data[path[0]], path[1:], default) if path else data
+        for key in path:
+            data = data[key]
+        return data
     except (KeyError, TypeError) as e:
-        if default == NotSpecified:
+        if default is NotSpecified:
             raise type(e)(f"{data=} {path=} {e!r}") from e
         return default
 
@@ -50,7 +64,7 @@ def set_multi(data, path: str | list[str], value):
     """
     assert path
     if isinstance(path, str):
-        path = path.split(".")
+        path = _split_path(path)
 
     head, tail = path[0], path[1:]
     if not tail:
@@ -59,6 +73,27 @@ def set_multi(data, path: str | list[str], value):
     set_multi(data.setdefault(head, {}), tail, value)
 
 
+def _pop_leaf(dat, key, default):
+    """Pop ``key`` from ``dat``, returning ``default`` (if any) when missing."""
+    try:
+        return dat.pop(key)
+    except KeyError:
+        if default is NotSpecified:
+            raise
+        return default
+
+
+def _pop_list_items(data: list, tail, default, val_to_del):
+    """Pop ``tail`` from each list item (the '[]' path expansion), pruning emptied items."""
+    ret = [
+        pop_multi(item, tail, default, True, val_to_del)
+        for item in data
+        if val_to_del is NotSpecified or item not in listify(val_to_del)
+    ]
+    data[:] = [item for item in data if item]  # remove empty items
+    return ret
+
+
 def pop_multi(
     data, path: str | list[str], default=NotSpecified, pop_list_items: bool = False, val_to_del=NotSpecified
 ):
@@ -81,51 +116,113 @@ def pop_multi(
     Note:
         Empty intermediate dictionaries are automatically removed after popping.
     """
-
-    def pop(dat, key):
-        try:
-            return dat.pop(key)
-        except KeyError:
-            if default == NotSpecified:
-                raise
-            return default
-
     if isinstance(path, str):
-        path = path.split(".")
-    if path:
-        head, tail = path[0], path[1:]
-
-        def _recurse(dat):
-            return pop_multi(dat, tail, default, pop_list_items, val_to_del)
+        path = _split_path(path)
+    if not path:
+        if default is NotSpecified:
+            raise KeyError(f"{path=}")
+        return default
 
+    # Walk the spine iteratively (no recursion, no path slicing); only the
+    # '[]' list expansion recurses, once per list level.
+    parents: list = []  # (container, key) pairs walked through, for empty-dict cleanup
+    last = len(path) - 1
+    for i, head in enumerate(path):
         if pop_list_items and head == "[]" and isinstance(data, list):
-            ret = [_recurse(item) for item in data if val_to_del is NotSpecified or item not in listify(val_to_del)]
-            data[:] = [item for item in data if item]  # remove empty items
-            return ret
-        if not tail:  # empty list means we're at the leaf of the tree
-            return pop(data, head)
+            ret = _pop_list_items(data, path[i + 1 :], default, val_to_del)
+            break
+        if i == last:  # at the leaf of the tree
+            ret = _pop_leaf(data, head, default)
+            break
         try:
-            data_head = data[head]
+            data_next = data[head]
         except KeyError as e:
-            if default == NotSpecified:
+            if default is NotSpecified:
                 raise type(e)(f"{head=} {path=} {data=}") from e
-            return default
+            ret = default
+            break  # fall through to the prune loop so walked empty dicts are still removed
         except TypeError as e:
             raise type(e)(f"{head=} {path=} {data=}") from e
-        ret = _recurse(data_head)
-        if not data[head]:
-            pop(data, head)
-        return ret
-    if default == NotSpecified:
-        raise KeyError(f"{path=}")
-    return default
+        parents.append((data, head))
+        data = data_next
+    for container, key in reversed(parents):
+        if not container[key]:
+            container.pop(key)
+        else:
+            break
+    return ret
+
+
+def _compile_predicate(predicate) -> t.Callable[[t.Any], bool]:
+    """Turn a predicate spec into a single value -> bool callable.
+
+    Dispatching on the predicate type happens here, once, instead of per value.
+    """
+    if callable(predicate):
+        return predicate
+    if isinstance(predicate, re.Pattern):
+        return lambda value: isinstance(value, str) and bool(predicate.search(value))
+    if isinstance(predicate, (list, set, tuple, frozenset)):
+        allowed = set(predicate)
+        return allowed.__contains__
+    if isinstance(predicate, dict):
+        return lambda value: bool(predicate.get(value))
+    return lambda value: value == predicate
+
+
+def split_dict(dic: dict, predicate) -> tuple[dict, dict]:
+    """Partition a dict into (matching, rest) by a predicate on its values.
+
+    The predicate may be a callable, a compiled regex (matched against string
+    values), a collection (membership test), a dict (truthy lookup) or a plain
+    value (equality). It is compiled to one callable up front, so the loop
+    does a single call per value with no repeated type dispatch.
+
+    >>> split_dict({"a": 1, "b": 2, "c": 3}, lambda v: v > 1)
+    ({'b': 2, 'c': 3}, {'a': 1})
+    """
+    pred = _compile_predicate(predicate)
+    matching: dict = {}
+    rest: dict = {}
+    for key, value in dic.items():
+        (matching if pred(value) else rest)[key] = value
+    return matching, rest
+
+
+def merge_struct(data1, data2):
+    """Merge data2 into data1 without mutating either; return the merged structure.
+
+    Dict nodes present in both sides are merged recursively; any other
+    conflict (or missing key) is resolved in favor of data2. Only dict nodes
+    on the paths actually touched by data2 are copied — untouched subtrees are
+    shared with the inputs — so the cost is O(changed nodes) instead of a full
+    deepcopy of data1.
+
+    >>> merge_struct({"a": {"b": 1, "c": 2}}, {"a": {"c": 3}, "d": 4})
+    {'a': {'b': 1, 'c': 3}, 'd': 4}
+    >>> merge_struct({"a": 1}, {"a": {"b": 2}})
+    {'a': {'b': 2}}
+    """
+    if isinstance(data1, dict) and isinstance(data2, dict):
+        merged = type(data1)(data1)
+        for key, value in data2.items():
+            merged[key] = merge_struct(merged[key], value) if key in merged else value
+        return merged
+    return data2
 
 
 def listify(data):
     """Ensure data is a list."""
+    # Exact type check first: skips the subclass MRO walk for the common case
+    if type(data) is list:  # pylint: disable=unidiomatic-typecheck
+        return data
+    # Cheap concrete-type checks for the common scalar inputs before falling
+    # back to the ABC-based Iterable check (slow __instancecheck__)
+    if data is None or isinstance(data, (str, bytes, int, float, bool)):
+        return [data]
     if isinstance(data, list):
         return data
-    if isinstance(data, Iterable) and not isinstance(data, (str, bytes)):
+    if isinstance(data, Iterable):
         return list(data)
     return [data]
 
@@ -157,19 +254,22 @@ def recurse(data: T, func: t.Callable[[t.Any], t.Any], what: t.Iterable[str] = (
     """
     what = set(listify(what))
     assert what and not what - {"key", "value"}, what
+    # Hoist the `what` membership tests out of the per-element loops: pick the
+    # specialized comprehension once instead of re-branching on every element.
+    do_key = "key" in what
+    do_value = "value" in what
 
-    def _recurse(data: T, func: t.Callable[[t.Any], t.Any], what: set[str]) -> T:
-        def apply(val, is_key: bool = False):
-            if is_key and "key" in what:
-                return func(val)
-            if not is_key and "value" in what:
-                return _recurse(val, func, what)
-            return val
-
+    def _recurse(data: T) -> T:
         if isinstance(data, dict):
-            return type(data)({apply(k, is_key=True): apply(v) for k, v in data.items()})
+            if do_key and do_value:
+                return type(data)({func(k): _recurse(v) for k, v in data.items()})
+            if do_key:
+                return type(data)({func(k): v for k, v in data.items()})
+            return type(data)({k: _recurse(v) for k, v in data.items()})
         if isinstance(data, (list, tuple, set)):
-            return type(data)(apply(item) for item in data)
-        return func(data) if "value" in what else data
+            if do_value:
+                return type(data)(_recurse(item) for item in data)
+            return type(data)(data)
+        return func(data) if do_value else data
 
-    return _recurse(data, func, what)
+    return _recurse(data)
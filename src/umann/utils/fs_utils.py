@@ -3,14 +3,26 @@
 This module focuses on repository- and project-root related path helpers.
 """
 
+import hashlib
 import os
+import re
 import typing as t  # pylint: disable=unused-import
 from functools import lru_cache
 
 from click import Path
 
+# Volume-prefix patterns and platform branch, resolved once at import instead
+# of per call.
+_WSL_VOLUME_RE = re.compile(r"^/mnt/([a-zA-Z])/")
+_WIN_VOLUME_RE = re.compile(r"^([a-zA-Z]):/")
+_IS_WIN = os.name == "nt"
+
+
+# Repository root resolved once at import: go up from this file to src/, then
+# one more level. The bare project_root() call returns this constant directly.
+_ROOT_ABS = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
 
-@lru_cache
 def project_root(file: str | Path | None = None, *, relative: bool = False, as_module: bool = False) -> str:
     """Return the absolute or relative project root directory.
 
@@ -25,13 +37,55 @@ def project_root(file: str | Path | None = None, *, relative: bool = False, as_m
     Returns:
         The project root path (optionally joined with ``file``).
     """
-    # Go up from this file to src/, then one more level to the repository root
-    parts = [os.path.dirname(__file__), "..", "..", ".."]
-    if file:
-        parts.append(str(file))
-    ret = os.path.realpath(os.path.join(*parts))
+    if file is None and not relative and not as_module:
+        # Overwhelmingly common case: skip even the lru_cache dispatch
+        return _ROOT_ABS
+    return _project_root(file, relative=relative, as_module=as_module)
+
+
+@lru_cache
+def _project_root(file: str | Path | None, *, relative: bool, as_module: bool) -> str:
+    """Cached slow path of ``project_root`` for parameterized calls.
+
+    The root itself is already realpath'd at import, so joining ``file`` is
+    pure string work — no per-call symlink resolution (lstat syscalls).
+    """
+    ret = os.path.normpath(os.path.join(_ROOT_ABS, str(file))) if file else _ROOT_ABS
     if relative or as_module:
         ret = os.path.relpath(ret, os.getcwd())
     if as_module:
         ret = ret.removesuffix(".py").replace(os.path.sep, ".").removeprefix("src.")
     return ret
+
+
+def _to_win_volume(fname: str) -> str:
+    """Convert a leading /mnt/<drive>/ prefix to <DRIVE>:/ notation."""
+    return _WSL_VOLUME_RE.sub(lambda m: f"{m.group(1).upper()}:/", fname)
+
+
+def _to_unx_volume(fname: str) -> str:
+    """Convert a leading <drive>:/ prefix to /mnt/<drive>/ notation."""
+    return _WIN_VOLUME_RE.sub(lambda m: f"/mnt/{m.group(1).lower()}/", fname)
+
+
+_volume_convert = _to_win_volume if _IS_WIN else _to_unx_volume
+
+
+def volume_convert(fname: str) -> str:
+    """Normalize backslashes and rewrite the volume prefix for the current platform.
+
+    On Windows '/mnt/c/...' becomes 'C:/...'; elsewhere 'C:/...' becomes
+    '/mnt/c/...'. The converter is picked once at import time.
+    """
+    return _volume_convert(fname.replace("\\", "/"))
+
+
+def md5_file(fname: str) -> str:
+    """Return the hex MD5 digest of a file's contents.
+
+    Uses ``hashlib.file_digest`` (Python 3.11+), which reads through the C
+    layer with large buffers and releases the GIL while hashing, instead of a
+    Python-level read loop.
+    """
+    with open(fname, "rb") as f:
+        return hashlib.file_digest(f, "md5").hexdigest()
@@ -0,0 +1,287 @@
+"""SQLite helpers for memoization-style caches.
+
+Thin wrappers around :mod:`sqlite3` used to persist expensive lookups
+(e.g. exiftool output) in a local database: bulk and single-row inserts,
+upserts, and an ``execute`` that reports failing SQL with its bind values.
+"""
+
+import re
+import sqlite3
+import sys
+import typing as t
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+
+from umann.utils.fs_utils import project_root
+from umann.utils.trace_utils import str_exc
+
+DEFAULT_DB_FILE = "data/memoize.sqlite3"
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER; newer builds allow 32766 but
+# 999 is the portable lower bound.
+SQLITE_MAX_VARS = 999
+
+
+def backtick(name: str) -> str:
+    """Quote an SQL identifier with backticks."""
+    return f"`{name}`"
+
+
+@lru_cache(maxsize=2048)
+def _placeholders(action: str, keys: tuple) -> str:
+    """Return the placeholder fragment for an (action, columns) shape (cached)."""
+    if action == "insert":
+        return ", ".join(["?"] * len(keys))
+    delim = ", " if action == "update" else " AND "
+    return delim.join(f"{backtick(k)}=?" for k in keys)
+
+
+def placeholder_and_values(where: dict, action: str) -> tuple[str, tuple]:
+    """Return an SQL placeholder fragment and the bind values for a column dict.
+
+    The fragment depends only on (action, column names), so it comes from an
+    lru-cached builder; repeated same-shape calls skip the join work.
+
+    Args:
+        where: Column-name to value mapping.
+        action: 'insert' for bare '?, ?, ...', 'update' for '`col`=?, ...',
+            anything else (WHERE clauses) for '`col`=? AND ...'.
+
+    Returns:
+        Tuple of (placeholder SQL fragment, values to bind).
+    """
+    return _placeholders(action, tuple(where)), tuple(where.values())
+
+
+def _sql_with_params(sql: str, parameters) -> str:
+    """Substitute bind values into SQL for error messages, in a single pass.
+
+    A replace-per-parameter loop rescans the whole SQL text each time, which
+    is O(n^2) on large multi-row statements; one re.sub with a values iterator
+    (or a name lookup for named parameters) keeps error formatting linear.
+    """
+    if isinstance(parameters, dict):
+        return re.sub(r":(\w+)", lambda m: repr(parameters.get(m.group(1), m.group(0))), sql)
+    reprs = (repr(value) for value in parameters)
+    return re.sub(r"\?", lambda _: next(reprs, "?"), sql)
+
+
+def execute(cursor: sqlite3.Cursor, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
+    """Execute SQL, re-raising errors with the bind values substituted for readability."""
+    try:
+        return cursor.execute(sql, parameters)
+    except sqlite3.Error as e:
+        raise type(e)(f"{_sql_with_params(sql, parameters)} {str_exc(e)}") from e
+
+
+@lru_cache
+def init(db_file: str | None = None) -> tuple[sqlite3.Connection, sqlite3.Cursor]:
+    """Open (and cache) the memoize database, returning (connection, cursor).
+
+    The connection is opened in autocommit mode (``isolation_level=None``) so
+    transaction boundaries are explicit (see ``insert``). Write-friendly
+    PRAGMAs are applied up front: WAL journaling with synchronous=NORMAL
+    fsyncs per checkpoint instead of per commit, temp tables stay in memory
+    and the page cache is raised to 64 MiB.
+    """
+    connection = sqlite3.connect(db_file or project_root(DEFAULT_DB_FILE), isolation_level=None)
+    connection.row_factory = sqlite3.Row
+    cursor = connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    return connection, cursor
+
+
+@contextmanager
+def bulk_mode(cursor: sqlite3.Cursor) -> t.Iterator[sqlite3.Cursor]:
+    """Temporarily disable journaling and fsyncs for a bulk rebuild.
+
+    Only safe for operations whose data can be regenerated if the process
+    dies mid-write (e.g. rebuilding a cache table from scratch); restores
+    WAL/NORMAL on exit.
+    """
+    cursor.execute("PRAGMA journal_mode=OFF")
+    cursor.execute("PRAGMA synchronous=OFF")
+    try:
+        yield cursor
+    finally:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+
+
+def _row_values_getter(cols: list) -> t.Callable[[dict], tuple]:
+    """Return a row dict -> values tuple extractor in cols order.
+
+    itemgetter iterates at C speed; the single-column case is wrapped so the
+    result is always a tuple, letting callers flatten with chain.from_iterable.
+    """
+    if len(cols) == 1:
+        key = cols[0]
+        return lambda d: (d[key],)
+    return itemgetter(*cols)
+
+
+@lru_cache(maxsize=256)
+def _values_placeholders(ncols: int, nrows: int) -> str:
+    """Return '(?, ?), (?, ?), ...' for nrows rows of ncols columns (cached)."""
+    row = "(" + ", ".join(["?"] * ncols) + ")"
+    return ", ".join([row] * nrows)
+
+
+def insert(cursor: sqlite3.Cursor, table: str, add: list[dict], ignore: bool = False, debug: bool = False) -> None:
+    """Bulk-insert rows as chunked multi-row INSERTs inside a single transaction.
+
+    Rows are split into chunks of ``SQLITE_MAX_VARS // ncols`` so the bind
+    count never exceeds SQLite's variable limit; each chunk is one multi-row
+    ``INSERT ... VALUES (...), (...)`` statement, amortizing statement dispatch
+    over many rows. The whole batch is wrapped in BEGIN/COMMIT (unless the
+    caller already opened a transaction), so there is one fsync per batch
+    instead of one per row.
+
+    Args:
+        cursor: Cursor to insert with.
+        table: Table name.
+        add: List of rows; all dicts must have the keys of the first row.
+        ignore: If True, use INSERT OR IGNORE.
+        debug: If True, print the generated SQL to stderr.
+
+    Note:
+        Callers that need per-row ``lastrowid`` should use ``insert1`` per row
+        inside one transaction instead.
+    """
+    if not add:
+        return
+    cols = list(add[0])
+    ncols = len(cols)
+    sql_head = (
+        f"INSERT {'OR IGNORE ' if ignore else ''}INTO {backtick(table)} "
+        f"({', '.join(backtick(k) for k in cols)}) VALUES "
+    )
+    chunk = max(1, SQLITE_MAX_VARS // ncols)
+    row_values = _row_values_getter(cols)
+    own_txn = not cursor.connection.in_transaction
+    if own_txn:
+        execute(cursor, "BEGIN")
+    try:
+        for i in range(0, len(add), chunk):
+            batch = add[i : i + chunk]
+            sql = sql_head + _values_placeholders(ncols, len(batch))
+            if debug:
+                print(sql, file=sys.stderr)
+            execute(cursor, sql, tuple(chain.from_iterable(map(row_values, batch))))
+        if own_txn:
+            execute(cursor, "COMMIT")
+    finally:
+        # Covers non-sqlite errors too (e.g. KeyError from a ragged row);
+        # after a successful COMMIT in_transaction is False, so this is a no-op.
+        if own_txn and cursor.connection.in_transaction:
+            execute(cursor, "ROLLBACK")
+
+
+def upsert(cursor: sqlite3.Cursor, table: str, rows: list[dict], uniq_keys: list[str]) -> list[int]:
+    """Upsert many rows in chunked multi-row statements; return their ids.
+
+    Like ``insert``, rows are split into chunks below SQLite's bind-parameter
+    limit; each chunk is one ``INSERT ... ON CONFLICT ... DO UPDATE SET
+    col=excluded.col ... RETURNING id``. Referencing ``excluded`` means every
+    value is bound once, instead of once for the INSERT and again for the
+    UPDATE clause.
+
+    Args:
+        cursor: Cursor to upsert with.
+        table: Table name.
+        rows: List of rows; all dicts must have the keys of the first row,
+            which must include the ``uniq_keys``.
+        uniq_keys: Columns of the unique constraint identifying rows.
+
+    Returns:
+        The ids of the inserted/updated rows.
+    """
+    if not rows:
+        return []
+    cols = list(rows[0])
+    # With nothing to update, still DO UPDATE a uniq column to itself so the
+    # conflicting rows show up in RETURNING (DO NOTHING would skip them).
+    update_cols = [k for k in cols if k not in uniq_keys] or list(uniq_keys)[:1]
+    sql_head = f"INSERT INTO {backtick(table)} ({', '.join(backtick(k) for k in cols)}) VALUES "
+    sql_tail = (
+        f" ON CONFLICT ({', '.join(backtick(k) for k in uniq_keys)}) "
+        f"DO UPDATE SET {', '.join(f'{backtick(k)}=excluded.{backtick(k)}' for k in update_cols)} "
+        f"RETURNING id"
+    )
+    chunk = max(1, SQLITE_MAX_VARS // len(cols))
+    row_values = _row_values_getter(cols)
+    ids: list[int] = []
+    own_txn = not cursor.connection.in_transaction
+    if own_txn:
+        execute(cursor, "BEGIN")
+    try:
+        for i in range(0, len(rows), chunk):
+            batch = rows[i : i + chunk]
+            sql = sql_head + _values_placeholders(len(cols), len(batch)) + sql_tail
+            execute(cursor, sql, tuple(chain.from_iterable(map(row_values, batch))))
+            ids.extend(row[0] for row in cursor.fetchall())
+        if own_txn:
+            execute(cursor, "COMMIT")
+    finally:
+        # Covers non-sqlite errors too (e.g. KeyError from a ragged row);
+        # after a successful COMMIT in_transaction is False, so this is a no-op.
+        if own_txn and cursor.connection.in_transaction:
+            execute(cursor, "ROLLBACK")
+    return ids
+
+
+@lru_cache(maxsize=512)
+def _build_insert_sql(table: str, keys: tuple, ignore: bool) -> str:
+    """Return the single-row INSERT statement for a (table, columns) shape (cached)."""
+    return (
+        f"INSERT {'OR IGNORE ' if ignore else ''}INTO {backtick(table)} "
+        f"({', '.join(backtick(k) for k in keys)}) VALUES ({', '.join(['?'] * len(keys))})"
+    )
+
+
+@lru_cache(maxsize=512)
+def _build_upsert_sql(table: str, add_keys: tuple, uniq_keys: tuple) -> str:
+    """Return the single-row upsert statement for a (table, columns) shape (cached)."""
+    all_keys = add_keys + tuple(k for k in uniq_keys if k not in add_keys)
+    # With nothing to update, still DO UPDATE a uniq column to itself so the
+    # conflicting row shows up in RETURNING (DO NOTHING would skip it).
+    update_keys = add_keys or uniq_keys[:1]
+    return (
+        f"INSERT INTO {backtick(table)} ({', '.join(backtick(k) for k in all_keys)}) "
+        f"VALUES ({', '.join(['?'] * len(all_keys))}) "
+        f"ON CONFLICT ({', '.join(backtick(k) for k in uniq_keys)}) "
+        f"DO UPDATE SET {', '.join(f'{backtick(k)}=excluded.{backtick(k)}' for k in update_keys)} "
+        f"RETURNING id"
+    )
+
+
+def insert1(cursor: sqlite3.Cursor, table: str, add: dict, ignore: bool = False) -> int | None:
+    """Insert a single row and return its rowid."""
+    execute(cursor, _build_insert_sql(table, tuple(add), ignore), tuple(add.values()))
+    return cursor.lastrowid
+
+
+def upsert1(cursor: sqlite3.Cursor, table: str, add: dict, uniq: dict) -> int:
+    """Insert or update a single row identified by the ``uniq`` columns; return its id.
+
+    The SQL text depends only on the (table, columns) shape, so it is looked
+    up from the lru-cached builder and SQLite's statement cache can reuse the
+    prepared statement across repeated same-shape calls. The conflict clause
+    references ``excluded``, so each value is bound exactly once.
+
+    Args:
+        cursor: Cursor to upsert with.
+        table: Table name.
+        add: Columns to insert and to update on conflict.
+        uniq: Columns of the unique constraint identifying the row.
+    """
+    sql = _build_upsert_sql(table, tuple(add), tuple(uniq))
+    # Chain the key iterations instead of allocating a merged add | uniq dict
+    values = tuple(chain(add.values(), (value for key, value in uniq.items() if key not in add)))
+    execute(cursor, sql, values)
+    return cursor.fetchone()[0]
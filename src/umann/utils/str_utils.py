@@ -0,0 +1,39 @@
+"""String helpers"""
+
+import re
+
+# Mojibake signature: a UTF-8 lead byte misdecoded as latin-1/cp1252 (Â Ã Ä Å â)
+# followed by a misdecoded continuation byte (raw \x80-\xbf, or the cp1252
+# punctuation those bytes map to). Compiled once at import.
+_MOJIBAKE_RE = re.compile("[\xc2-\xc5\xe2][\x80-\xbfŒœŠšŽžƒˆ˜–—‘’‚“”„†‡•…‰‹›€™]")
+
+# Candidate encodings the text may have been misdecoded with, most likely first
+_MOJIBAKE_ENCODINGS = ("latin1", "cp1252", "mac_roman")
+
+
+def fix_str_encoding(text: str) -> str:
+    """Repair UTF-8 text that was misdecoded as latin-1/cp1252 (mojibake).
+
+    ASCII strings (the vast majority) return immediately without touching the
+    regex engine; non-ASCII strings without the mojibake signature return
+    after one search. Otherwise each candidate source encoding is round-tripped
+    once and the loop short-circuits on the first fix that removes the
+    signature.
+
+    >>> fix_str_encoding("CafÃ©")
+    'Café'
+    >>> fix_str_encoding("plain ascii")
+    'plain ascii'
+    """
+    if not text or text.isascii():
+        return text
+    if not _MOJIBAKE_RE.search(text):
+        return text
+    for encoding in _MOJIBAKE_ENCODINGS:
+        try:
+            fixed = text.encode(encoding).decode("utf-8")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            continue
+        if not _MOJIBAKE_RE.search(fixed):
+            return fixed
+    return text
@@ -3,12 +3,13 @@
 Tests the data manipulation functions like get_multi, set_multi, and pop_multi.
 """
 
+import re
 import unittest
 
 import pytest
 from parameterized import parameterized
 
-from umann.utils.data_utils import NotSpecified, get_multi, listify, pop_multi, set_multi
+from umann.utils.data_utils import NotSpecified, get_multi, listify, merge_struct, pop_multi, set_multi, split_dict
 
 pytestmark = pytest.mark.unit
 
@@ -128,6 +129,12 @@ class TestPopMulti(unittest.TestCase):
         self.assertNotIn("a", data)
         self.assertEqual(data, {"other": "value"})
 
+    def test_pop_multi_missing_midpath_prunes_empty_dicts(self):
+        """Empty dicts on the walked spine are pruned even when the path misses."""
+        data = {"a": {}, "keep": 1}
+        self.assertIsNone(pop_multi(data, "a.b.c", default=None))
+        self.assertEqual(data, {"keep": 1})
+
     def test_pop_multi_list_items(self):
         """Test popping items from lists with specific values."""
         data = {"a": {"b": [1, 2, 3, 4]}}
@@ -153,6 +160,57 @@ class TestPopMulti(unittest.TestCase):
         self.assertEqual(result, "value1")
 
 
+class TestSplitDict(unittest.TestCase):
+    """Tests for split_dict function."""
+
+    @parameterized.expand(
+        [
+            ("callable", lambda v: v > 1, {"b": 2, "c": 3}, {"a": 1}),
+            ("membership", [1, 3], {"a": 1, "c": 3}, {"b": 2}),
+            ("equality", 2, {"b": 2}, {"a": 1, "c": 3}),
+        ]
+    )
+    def test_split_dict_predicates(self, _name, predicate, expected_matching, expected_rest):
+        """Callable, collection and plain-value predicates should all partition by value."""
+        matching, rest = split_dict({"a": 1, "b": 2, "c": 3}, predicate)
+        self.assertEqual(matching, expected_matching)
+        self.assertEqual(rest, expected_rest)
+
+    def test_split_dict_regex(self):
+        """Compiled regex predicates should match string values only."""
+        matching, rest = split_dict({"a": "foo", "b": "bar", "c": 42}, re.compile("^f"))
+        self.assertEqual(matching, {"a": "foo"})
+        self.assertEqual(rest, {"b": "bar", "c": 42})
+
+
+class TestMergeStruct(unittest.TestCase):
+    """Tests for merge_struct function."""
+
+    def test_merge_struct_recursive(self):
+        """Dicts present on both sides should be merged key by key."""
+        merged = merge_struct({"a": {"b": 1, "c": 2}}, {"a": {"c": 3}, "d": 4})
+        self.assertEqual(merged, {"a": {"b": 1, "c": 3}, "d": 4})
+
+    def test_merge_struct_second_wins_on_conflict(self):
+        """Non-dict conflicts should be resolved in favor of the second argument."""
+        self.assertEqual(merge_struct({"a": 1}, {"a": [2]}), {"a": [2]})
+        self.assertEqual(merge_struct(1, 2), 2)
+
+    def test_merge_struct_does_not_mutate_inputs(self):
+        """Neither input should be modified by the merge."""
+        data1 = {"a": {"b": 1}}
+        data2 = {"a": {"c": 2}}
+        merge_struct(data1, data2)
+        self.assertEqual(data1, {"a": {"b": 1}})
+        self.assertEqual(data2, {"a": {"c": 2}})
+
+    def test_merge_struct_shares_untouched_subtrees(self):
+        """Subtrees not touched by data2 should be shared, not copied."""
+        untouched = {"deep": [1, 2, 3]}
+        merged = merge_struct({"a": untouched, "b": {"c": 1}}, {"b": {"c": 2}})
+        self.assertIs(merged["a"], untouched)
+
+
 class TestNotSpecified(unittest.TestCase):
     """Tests for NotSpecified sentinel class."""
 
@@ -176,6 +234,9 @@ class TestDataUtils(unittest.TestCase):
             ({1, 2}, {1, 2}, True),
             ([1, 2], [1, 2], False),
             (None, [None], False),
+            ("abc", ["abc"], False),
+            (b"abc", [b"abc"], False),
+            ({"a": 1, "b": 2}, ["a", "b"], False),
         ]
     )
     def test_listify_with_list(self, inp, expected, compare_as_set):
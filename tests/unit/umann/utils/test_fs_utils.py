@@ -3,12 +3,15 @@
 Tests the basic utility functions like project_root path resolution.
 """
 
+import hashlib
+import os
+import tempfile
 import unittest
 from pathlib import Path
 
 import pytest
 
-from umann.utils.fs_utils import project_root
+from umann.utils.fs_utils import _to_unx_volume, _to_win_volume, md5_file, project_root, volume_convert
 
 pytestmark = pytest.mark.unit  # Mark all tests in this module as unit tests
 
@@ -20,3 +23,25 @@ class TestFsUtils(unittest.TestCase):
         """project_root should resolve to the repository root directory."""
         result = Path(project_root())
         assert result == Path(__file__).parent.parent.parent.parent.parent
+
+    def test_volume_convert_directions(self):
+        """Both volume-prefix directions should convert and lowercase/uppercase the drive."""
+        assert _to_win_volume("/mnt/c/Users/me/file.txt") == "C:/Users/me/file.txt"
+        assert _to_unx_volume("C:/Users/me/file.txt") == "/mnt/c/Users/me/file.txt"
+
+    def test_volume_convert_normalizes_backslashes(self):
+        """Backslashes should be normalized before the prefix rewrite."""
+        expected = "D:/data" if os.name == "nt" else "/mnt/d/data"
+        assert volume_convert("D:\\data") == expected
+
+    def test_volume_convert_no_prefix_untouched(self):
+        """Paths without a volume prefix should only get slash normalization."""
+        assert volume_convert("some\\relative\\path") == "some/relative/path"
+
+    def test_md5_file(self):
+        """md5_file should match hashlib.md5 of the file contents."""
+        content = b"some content\n" * 1000
+        with tempfile.NamedTemporaryFile() as tmp:
+            tmp.write(content)
+            tmp.flush()
+            assert md5_file(tmp.name) == hashlib.md5(content).hexdigest()
@@ -0,0 +1,210 @@
+"""Unit tests for SQLite helper functions.
+
+Tests the memoize-style helpers: placeholder building, bulk insert,
+single-row insert and upsert against an in-memory database.
+"""
+
+import sqlite3
+import tempfile
+import unittest
+
+import pytest
+
+from umann.utils.sql_utils import (
+    backtick,
+    bulk_mode,
+    execute,
+    init,
+    insert,
+    insert1,
+    placeholder_and_values,
+    upsert,
+    upsert1,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def make_cursor() -> sqlite3.Cursor:
+    """Create an in-memory database with a test table and return a cursor."""
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    connection.row_factory = sqlite3.Row
+    cursor = connection.cursor()
+    cursor.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT UNIQUE, value INTEGER)")
+    return cursor
+
+
+class TestSqlFragments(unittest.TestCase):
+    """Tests for backtick and placeholder_and_values."""
+
+    def test_backtick(self):
+        """Identifiers should be wrapped in backticks."""
+        self.assertEqual(backtick("name"), "`name`")
+
+    def test_placeholder_insert(self):
+        """Insert action should produce bare question marks."""
+        placeholders, values = placeholder_and_values({"a": 1, "b": 2}, "insert")
+        self.assertEqual(placeholders, "?, ?")
+        self.assertEqual(values, (1, 2))
+
+    def test_placeholder_update(self):
+        """Update action should produce comma-separated assignments."""
+        placeholders, values = placeholder_and_values({"a": 1, "b": 2}, "update")
+        self.assertEqual(placeholders, "`a`=?, `b`=?")
+        self.assertEqual(values, (1, 2))
+
+    def test_placeholder_where(self):
+        """Non-insert/update action should produce AND-separated conditions."""
+        placeholders, _values = placeholder_and_values({"a": 1, "b": 2}, "where")
+        self.assertEqual(placeholders, "`a`=? AND `b`=?")
+
+
+class TestExecute(unittest.TestCase):
+    """Tests for the execute wrapper."""
+
+    def test_execute_ok(self):
+        """Plain execution should work and return the cursor."""
+        cursor = make_cursor()
+        execute(cursor, "INSERT INTO t (name, value) VALUES (?, ?)", ("a", 1))
+        self.assertEqual(cursor.execute("SELECT count(*) FROM t").fetchone()[0], 1)
+
+    def test_execute_error_includes_params(self):
+        """Errors should be re-raised with bind values substituted into the SQL."""
+        cursor = make_cursor()
+        with self.assertRaises(sqlite3.Error) as ctx:
+            execute(cursor, "INSERT INTO nope (name) VALUES (?)", ("a",))
+        self.assertIn("'a'", str(ctx.exception))
+
+
+class TestInsert(unittest.TestCase):
+    """Tests for bulk insert."""
+
+    def test_insert_bulk(self):
+        """All rows should be inserted in one transaction."""
+        cursor = make_cursor()
+        insert(cursor, "t", [{"name": f"n{i}", "value": i} for i in range(100)])
+        self.assertEqual(cursor.execute("SELECT count(*) FROM t").fetchone()[0], 100)
+        self.assertFalse(cursor.connection.in_transaction)
+
+    def test_insert_empty(self):
+        """An empty batch should be a no-op."""
+        cursor = make_cursor()
+        insert(cursor, "t", [])
+        self.assertEqual(cursor.execute("SELECT count(*) FROM t").fetchone()[0], 0)
+
+    def test_insert_ignore(self):
+        """Duplicate unique keys should be skipped with ignore=True."""
+        cursor = make_cursor()
+        insert(cursor, "t", [{"name": "a", "value": 1}])
+        insert(cursor, "t", [{"name": "a", "value": 2}, {"name": "b", "value": 3}], ignore=True)
+        rows = cursor.execute("SELECT name, value FROM t ORDER BY name").fetchall()
+        self.assertEqual([(r["name"], r["value"]) for r in rows], [("a", 1), ("b", 3)])
+
+    def test_insert_large_batch_exceeding_var_limit(self):
+        """Batches needing more than SQLITE_MAX_VARS binds should be chunked transparently."""
+        cursor = make_cursor()
+        insert(cursor, "t", [{"name": f"n{i}", "value": i} for i in range(1000)])
+        self.assertEqual(cursor.execute("SELECT count(*) FROM t").fetchone()[0], 1000)
+        self.assertEqual(cursor.execute("SELECT value FROM t WHERE name='n999'").fetchone()[0], 999)
+
+    def test_insert_ragged_rows_leave_no_open_transaction(self):
+        """A non-sqlite error (row missing a key) should also roll back, not leave a dangling transaction."""
+        cursor = make_cursor()
+        with self.assertRaises(KeyError):
+            insert(cursor, "t", [{"name": "a", "value": 1}, {"name": "b"}])
+        self.assertFalse(cursor.connection.in_transaction)
+        insert(cursor, "t", [{"name": "c", "value": 3}])  # next batch still commits
+        self.assertFalse(cursor.connection.in_transaction)
+        self.assertEqual(cursor.execute("SELECT count(*) FROM t").fetchone()[0], 1)
+
+    def test_insert_rolls_back_on_error(self):
+        """A failing batch should leave no partial rows behind."""
+        cursor = make_cursor()
+        with self.assertRaises(sqlite3.Error):
+            insert(cursor, "t", [{"name": "a", "value": 1}, {"name": "a", "value": 2}])
+        self.assertEqual(cursor.execute("SELECT count(*) FROM t").fetchone()[0], 0)
+        self.assertFalse(cursor.connection.in_transaction)
+
+
+class TestInit(unittest.TestCase):
+    """Tests for init PRAGMA tuning and bulk mode."""
+
+    def test_init_sets_wal_and_synchronous_normal(self):
+        """init should enable WAL journaling with synchronous=NORMAL."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            connection, cursor = init(f"{tmpdir}/memoize.sqlite3")
+            self.assertEqual(cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+            init.cache_clear()
+            connection.close()
+
+    def test_bulk_mode_restores_pragmas(self):
+        """bulk_mode should turn fsyncs off inside the block and restore them after."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            connection, cursor = init(f"{tmpdir}/memoize.sqlite3")
+            with bulk_mode(cursor):
+                self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 0)  # OFF
+            self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+            self.assertEqual(cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            init.cache_clear()
+            connection.close()
+
+
+class TestInsert1(unittest.TestCase):
+    """Tests for single-row insert."""
+
+    def test_insert1_returns_rowid(self):
+        """insert1 should return the rowid of the new row."""
+        cursor = make_cursor()
+        rowid = insert1(cursor, "t", {"name": "a", "value": 1})
+        self.assertEqual(cursor.execute("SELECT id FROM t WHERE name='a'").fetchone()[0], rowid)
+
+
+class TestUpsert(unittest.TestCase):
+    """Tests for batch upsert."""
+
+    def test_upsert_insert_then_update(self):
+        """Re-upserting the same uniq values should update rows and keep their ids."""
+        cursor = make_cursor()
+        ids1 = upsert(cursor, "t", [{"name": "a", "value": 1}, {"name": "b", "value": 2}], ["name"])
+        ids2 = upsert(cursor, "t", [{"name": "a", "value": 10}, {"name": "b", "value": 20}], ["name"])
+        self.assertEqual(sorted(ids1), sorted(ids2))
+        rows = cursor.execute("SELECT name, value FROM t ORDER BY name").fetchall()
+        self.assertEqual([(r["name"], r["value"]) for r in rows], [("a", 10), ("b", 20)])
+
+    def test_upsert_large_batch(self):
+        """Batches above the bind-parameter limit should be chunked and return all ids."""
+        cursor = make_cursor()
+        ids = upsert(cursor, "t", [{"name": f"n{i}", "value": i} for i in range(1000)], ["name"])
+        self.assertEqual(len(ids), 1000)
+        self.assertEqual(cursor.execute("SELECT count(*) FROM t").fetchone()[0], 1000)
+
+    def test_upsert_empty(self):
+        """An empty batch should return no ids."""
+        cursor = make_cursor()
+        self.assertEqual(upsert(cursor, "t", [], ["name"]), [])
+
+
+class TestUpsert1(unittest.TestCase):
+    """Tests for single-row upsert."""
+
+    def test_upsert1_empty_add(self):
+        """With no columns to update, upsert1 should still return the existing row's id."""
+        cursor = make_cursor()
+        id1 = upsert1(cursor, "t", {"value": 1}, {"name": "a"})
+        id2 = upsert1(cursor, "t", {}, {"name": "a"})
+        self.assertEqual(id1, id2)
+        self.assertEqual(cursor.execute("SELECT value FROM t WHERE name='a'").fetchone()[0], 1)
+
+    def test_upsert1_insert_then_update(self):
+        """Second upsert with the same uniq columns should update in place."""
+        cursor = make_cursor()
+        id1 = upsert1(cursor, "t", {"value": 1}, {"name": "a"})
+        id2 = upsert1(cursor, "t", {"value": 2}, {"name": "a"})
+        self.assertEqual(id1, id2)
+        self.assertEqual(cursor.execute("SELECT value FROM t WHERE name='a'").fetchone()[0], 2)
+        self.assertEqual(cursor.execute("SELECT count(*) FROM t").fetchone()[0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Unit tests for string utility functions.
+
+Tests mojibake detection and repair in fix_str_encoding.
+"""
+
+import unittest
+
+import pytest
+from parameterized import parameterized
+
+from umann.utils.str_utils import fix_str_encoding
+
+pytestmark = pytest.mark.unit
+
+
+class TestFixStrEncoding(unittest.TestCase):
+    """Tests for fix_str_encoding function."""
+
+    @parameterized.expand(
+        [
+            ("ascii", "plain ascii", "plain ascii"),
+            ("empty", "", ""),
+            ("already_correct", "Café Umeå", "Café Umeå"),
+            ("latin1_utf8", "CafÃ©", "Café"),
+            ("latin1_hungarian", "Ã¡rvÃ­ztÅ±rÅ‘", "árvíztűrő"),
+            ("cp1252_apostrophe", "donâ€™t", "don’t"),
+        ]
+    )
+    def test_fix_str_encoding(self, _name, text, expected):
+        """Mojibake should be repaired; clean strings should pass through unchanged."""
+        self.assertEqual(fix_str_encoding(text), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,22 @@
 
 import pytest
 
+from umann.utils import trace_utils
 from umann.utils.trace_utils import calling_signature
 
 pytestmark = pytest.mark.unit
 
 
+def test_calling_signature_disabled(monkeypatch):
+    """When TRACE_ENABLED is False, calling_signature should return '' immediately."""
+    monkeypatch.setattr(trace_utils, "TRACE_ENABLED", False)
+
+    def my_func(_a):
+        return calling_signature()
+
+    assert my_func(1) == ""
+
+
 def test_calling_signature_with_positional_args():
     """Test calling_signature with only positional arguments."""
 